@@ -24,6 +24,7 @@ SCOPE_STATE_RESPONSE_COMPRESSED: Final = "response_compressed"
 SCOPE_STATE_DO_CACHE: Final = "do_cache"
 SCOPE_STATE_IS_CACHED: Final = "is_cached"
 SKIP_VALIDATION_NAMES: Final = {"request", "socket", "scope", "receive", "send"}
+UTF8: Final = "utf-8"
 UNDEFINED_SENTINELS: Final = {Signature.empty, Empty, Ellipsis, MISSING, UnsetType}
 WEBSOCKET_CLOSE: Final = "websocket.close"
 WEBSOCKET_DISCONNECT: Final = "websocket.disconnect"
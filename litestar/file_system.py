@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from os import stat
 from stat import S_ISDIR
 from typing import TYPE_CHECKING, Any, AnyStr, cast
 
@@ -35,7 +36,7 @@ class BaseLocalFileSystem(FileSystemProtocol):
         Returns:
             A dictionary of file info.
         """
-        result = await Path(path).stat()
+        result = await run_sync(stat, path)
         return await FileSystemAdapter.parse_stat_result(path=path, result=result)
 
     async def open(self, file: PathType, mode: str, buffering: int = -1) -> AsyncFile[AnyStr]:
@@ -62,6 +63,9 @@ class FileSystemAdapter:
             file_system: A filesystem class adhering to the :class:`FileSystemProtocol <litestar.types.FileSystemProtocol>`
         """
         self.file_system = file_system
+        # resolved once per adapter, so the callables are not re-inspected on every request
+        self._info_is_async = is_async_callable(file_system.info)
+        self._open_is_async = is_async_callable(file_system.open)  # pyright: ignore
 
     async def info(self, path: PathType) -> FileInfo:
         """Proxies the call to the underlying FS Spec's ``info`` method, ensuring it's done in an async fashion and with
@@ -76,7 +80,7 @@ class FileSystemAdapter:
         try:
             awaitable = (
                 self.file_system.info(str(path))
-                if is_async_callable(self.file_system.info)
+                if self._info_is_async
                 else run_sync(self.file_system.info, str(path))
             )
             return cast("FileInfo", await awaitable)
@@ -104,7 +108,7 @@ class FileSystemAdapter:
             buffering: Buffer size.
         """
         try:
-            if is_async_callable(self.file_system.open):  # pyright: ignore
+            if self._open_is_async:
                 return cast(
                     "AsyncFile[bytes]",
                     await self.file_system.open(
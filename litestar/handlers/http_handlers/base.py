@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, AnyStr, Mapping, TypedDict, cast
+from typing import TYPE_CHECKING, AnyStr, Mapping, cast
 
 from litestar._layers.utils import narrow_response_cookies, narrow_response_headers
 from litestar.datastructures.cookie import Cookie
@@ -20,7 +20,7 @@ from litestar.handlers.http_handlers._utils import (
     normalize_http_method,
 )
 from litestar.openapi.spec import Operation
-from litestar.response import Response
+from litestar.response import Response, Template
 from litestar.status_codes import HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 from litestar.types import (
     AfterRequestHookHandler,
@@ -62,11 +62,6 @@ if TYPE_CHECKING:
 __all__ = ("HTTPRouteHandler", "route")
 
 
-class ResponseHandlerMap(TypedDict):
-    default_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
-    response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
-
-
 class HTTPRouteHandler(BaseRouteHandler):
     """HTTP Route Decorator.
 
@@ -74,10 +69,11 @@ class HTTPRouteHandler(BaseRouteHandler):
     """
 
     __slots__ = (
+        "_default_response_handler",
         "_resolved_after_response",
         "_resolved_before_request",
-        "_response_handler_mapping",
         "_resolved_include_in_schema",
+        "_response_type_handler",
         "after_request",
         "after_response",
         "background",
@@ -278,7 +274,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         # memoized attributes, defaulted to Empty
         self._resolved_after_response: AsyncAnyCallable | None | EmptyType = Empty
         self._resolved_before_request: AsyncAnyCallable | None | EmptyType = Empty
-        self._response_handler_mapping: ResponseHandlerMap = {"default_handler": Empty, "response_type_handler": Empty}
+        self._default_response_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
+        self._response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
         self._resolved_include_in_schema: bool | EmptyType = Empty
 
     def __call__(self, fn: AnyCallable) -> HTTPRouteHandler:
@@ -417,7 +414,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             Async Callable to handle an HTTP Request
         """
-        if self._response_handler_mapping["default_handler"] is Empty:
+        if self._default_response_handler is Empty:
             after_request_handlers: list[AsyncAnyCallable] = [
                 layer.after_request  # type: ignore[misc]
                 for layer in self.ownership_layers
@@ -437,7 +434,7 @@ class HTTPRouteHandler(BaseRouteHandler):
             return_type = self.parsed_fn_signature.return_type
             return_annotation = return_type.annotation
 
-            self._response_handler_mapping["response_type_handler"] = response_type_handler = create_response_handler(
+            self._response_type_handler = response_type_handler = create_response_handler(
                 after_request=after_request,
                 background=self.background,
                 cookies=cookies,
@@ -448,13 +445,11 @@ class HTTPRouteHandler(BaseRouteHandler):
             )
 
             if return_type.is_subclass_of(Response):
-                self._response_handler_mapping["default_handler"] = response_type_handler
+                self._default_response_handler = response_type_handler
             elif is_async_callable(return_annotation) or return_annotation is ASGIApp:
-                self._response_handler_mapping["default_handler"] = create_generic_asgi_response_handler(
-                    after_request=after_request
-                )
+                self._default_response_handler = create_generic_asgi_response_handler(after_request=after_request)
             else:
-                self._response_handler_mapping["default_handler"] = create_data_handler(
+                self._default_response_handler = create_data_handler(
                     after_request=after_request,
                     background=self.background,
                     cookies=cookies,
@@ -467,9 +462,7 @@ class HTTPRouteHandler(BaseRouteHandler):
 
         return cast(
             "Callable[[Any], Awaitable[ASGIApp]]",
-            self._response_handler_mapping["response_type_handler"]
-            if is_response_type_data
-            else self._response_handler_mapping["default_handler"],
+            self._response_type_handler if is_response_type_data else self._default_response_handler,
         )
 
     async def to_response(self, app: Litestar, data: Any, request: Request) -> ASGIApp:
@@ -500,6 +493,9 @@ class HTTPRouteHandler(BaseRouteHandler):
             self._fn = ensure_async_callable(self.fn)
             self.has_sync_callable = False
 
+        if app.template_engine is None and self.parsed_fn_signature.return_type.is_subclass_of(Template):
+            raise ImproperlyConfiguredException("Template engine is not configured")
+
     def _validate_handler_function(self) -> None:
         """Validate the route handler function once it is set by inspecting its return annotations."""
         super()._validate_handler_function()
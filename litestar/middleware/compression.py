@@ -196,6 +196,14 @@ class CompressionMiddleware(AbstractMiddleware):
                 await send(message)
                 return
 
+            if message["type"] != "http.response.body":
+                # an event such as "http.response.pathsend" carries no body for the middleware to
+                # compress, so flush the withheld start event and forward the message unchanged
+                if initial_message:
+                    await send(initial_message)
+                await send(message)
+                return
+
             if initial_message and message["type"] == "http.response.body":
                 body = message["body"]
                 more_body = message.get("more_body")
@@ -43,7 +43,13 @@ class ResponseCacheMiddleware(AbstractMiddleware):
                     if do_cache:
                         messages.append(message)
                 elif get_litestar_scope_state(scope, SCOPE_STATE_DO_CACHE):
-                    messages.append(message)
+                    if message["type"] == HTTP_RESPONSE_BODY:
+                        messages.append(message)
+                    else:
+                        # an event such as "http.response.pathsend" delegates the response body to
+                        # the server, leaving nothing that could be replayed from the cache
+                        set_litestar_scope_state(scope, SCOPE_STATE_DO_CACHE, False)
+                        messages.clear()
 
                 if messages and message["type"] == HTTP_RESPONSE_BODY and not message["more_body"]:
                     key = (route_handler.cache_key_builder or self.config.key_builder)(Request(scope))
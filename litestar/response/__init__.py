@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from .base import Response
-from .file import File
-from .redirect import Redirect
-from .sse import ServerSentEvent
-from .streaming import Stream
-from .template import Template
+
+if TYPE_CHECKING:
+    from .file import File
+    from .redirect import Redirect
+    from .sse import ServerSentEvent
+    from .streaming import Stream
+    from .template import Template
 
 __all__ = (
     "File",
@@ -13,3 +17,25 @@ __all__ = (
     "Stream",
     "Template",
 )
+
+_submodule_by_name = {
+    "File": "file",
+    "Redirect": "redirect",
+    "ServerSentEvent": "sse",
+    "Stream": "streaming",
+    "Template": "template",
+}
+
+
+def __getattr__(attr_name: str) -> object:
+    # the response classes are imported lazily so that applications only pay the import cost of the
+    # response kinds they actually use
+    if submodule_name := _submodule_by_name.get(attr_name):
+        from importlib import import_module
+
+        submodule = import_module(f".{submodule_name}", __name__)
+
+        value = globals()[attr_name] = getattr(submodule, attr_name)
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
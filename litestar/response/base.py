@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import itertools
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Literal, Mapping, TypeVar, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Literal, Mapping, Sequence, TypeVar, overload
 
+from litestar.constants import UTF8
 from litestar.datastructures.cookie import Cookie
 from litestar.datastructures.headers import ETag, MutableScopeHeaders
 from litestar.enums import MediaType, OpenAPIMediaType
@@ -34,6 +35,9 @@ __all__ = ("ASGIResponse", "Response")
 
 T = TypeVar("T")
 
+_EMPTY_RESPONSE_COOKIES: tuple[Cookie, ...] = ()
+"""A shared empty-cookies sentinel, so responses without cookies do not each allocate an empty list."""
+
 
 class ASGIResponse:
     """A low-level ASGI response class."""
@@ -60,7 +64,7 @@ class ASGIResponse:
         content_length: int | None = None,
         cookies: Iterable[Cookie] | None = None,
         encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: dict[str, Any] | Iterable[tuple[str, str]] | None = None,
         is_head_response: bool = False,
         media_type: MediaType | str | None = None,
@@ -221,7 +225,7 @@ class Response(Generic[T]):
         *,
         background: BackgroundTask | BackgroundTasks | None = None,
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: ResponseHeaders | None = None,
         media_type: MediaType | OpenAPIMediaType | str | None = None,
         status_code: int | None = None,
@@ -244,18 +248,34 @@ class Response(Generic[T]):
         """
         self.content = content
         self.background = background
-        self.cookies: list[Cookie] = (
-            [Cookie(key=key, value=value) for key, value in cookies.items()]
-            if isinstance(cookies, Mapping)
-            else list(cookies or [])
-        )
+
+        # the branches are laid out explicitly so the common "nothing passed" case does not allocate
+        # intermediate containers that are immediately discarded
+        if cookies is None:
+            self.cookies: Sequence[Cookie] = _EMPTY_RESPONSE_COOKIES
+        elif isinstance(cookies, Mapping):
+            self.cookies = [Cookie(key=key, value=value) for key, value in cookies.items()]
+        else:
+            self.cookies = list(cookies)
+
         self.encoding = encoding
-        self.headers: dict[str, Any] = (
-            dict(headers) if isinstance(headers, Mapping) else {h.name: h.value for h in headers or {}}
-        )
+
+        if headers is None:
+            self.headers: dict[str, Any] = {}
+        elif isinstance(headers, Mapping):
+            self.headers = dict(headers)
+        else:
+            self.headers = {h.name: h.value for h in headers}
+
         self.media_type = media_type
         self.status_code = status_code
-        self.response_type_encoders = {**(self.type_encoders or {}), **(type_encoders or {})}
+
+        if type_encoders:
+            self.response_type_encoders = {**(self.type_encoders or {}), **type_encoders}
+        elif self.type_encoders:
+            self.response_type_encoders = dict(self.type_encoders)
+        else:
+            self.response_type_encoders = {}
 
     @overload
     def set_cookie(self, /, cookie: Cookie) -> None:
@@ -317,7 +337,10 @@ class Response(Generic[T]):
                 secure=secure,
                 value=value,
             )
-        self.cookies.append(key)
+        cookies = self.cookies
+        if not isinstance(cookies, list):
+            cookies = self.cookies = list(cookies)
+        cookies.append(key)
 
     def set_header(self, key: str, value: Any) -> None:
         """Set a header on the response.
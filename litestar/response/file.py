@@ -4,15 +4,18 @@ import itertools
 from email.utils import formatdate
 from inspect import iscoroutine
 from mimetypes import encodings_map, guess_type
+from os import fspath
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Iterable, Literal, cast
 from urllib.parse import quote
 from zlib import adler32
 
-from litestar.constants import ONE_MEGABYTE
+from litestar.constants import ONE_MEGABYTE, UTF8
+from litestar.datastructures.headers import ETag
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
 from litestar.response.base import Response
 from litestar.response.streaming import ASGIStreamingResponse
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
 from litestar.utils.deprecation import warn_deprecation
 from litestar.utils.helpers import get_enum_string_value
 
@@ -26,14 +29,15 @@ if TYPE_CHECKING:
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
     from litestar.connection import Request
     from litestar.datastructures.cookie import Cookie
-    from litestar.datastructures.headers import ETag
     from litestar.enums import MediaType
     from litestar.types import (
         HTTPResponseBodyEvent,
+        HTTPResponsePathsendEvent,
         PathType,
         Receive,
         ResponseCookies,
         ResponseHeaders,
+        Scope,
         Send,
         TypeEncodersMap,
     )
@@ -49,6 +53,12 @@ __all__ = (
 # brotli not supported in 'mimetypes.encodings_map' until py 3.9.
 encodings_map[".br"] = "br"
 
+_validated_file_system_types: set[type] = {BaseLocalFileSystem}
+"""File system types known to adhere to the ``FileSystemProtocol``, so instances can skip re-validation."""
+
+_default_file_system_adapter = FileSystemAdapter(BaseLocalFileSystem())
+"""A shared adapter over the default local file system, which is stateless, so responses need not allocate their own."""
+
 
 async def async_file_iterator(
     file_path: PathType, chunk_size: int, adapter: FileSystemAdapter
@@ -85,6 +95,15 @@ def create_etag_for_file(path: PathType, modified_time: float, file_size: int) -
 class ASGIFileResponse(ASGIStreamingResponse):
     """A low-level ASGI response, streaming a file as response body."""
 
+    __slots__ = (
+        "adapter",
+        "chunk_size",
+        "etag",
+        "file_info",
+        "file_path",
+        "is_local_file_system",
+    )
+
     def __init__(
         self,
         *,
@@ -95,7 +114,7 @@ class ASGIFileResponse(ASGIStreamingResponse):
         content_length: int | None = None,
         cookies: Iterable[Cookie] | None = None,
         encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         etag: ETag | None = None,
         file_info: FileInfo | Coroutine[None, None, FileInfo] | None = None,
         file_path: str | PathLike | Path,
@@ -137,7 +156,7 @@ class ASGIFileResponse(ASGIStreamingResponse):
             if content_encoding is not None:
                 headers.update({"content-encoding": content_encoding})
 
-        self.adapter = FileSystemAdapter(file_system or BaseLocalFileSystem())
+        self.adapter = FileSystemAdapter(file_system) if file_system is not None else _default_file_system_adapter
 
         super().__init__(
             iterator=async_file_iterator(file_path=file_path, chunk_size=chunk_size, adapter=self.adapter),
@@ -165,6 +184,9 @@ class ASGIFileResponse(ASGIStreamingResponse):
         self.chunk_size = chunk_size
         self.etag = etag
         self.file_path = file_path
+        # an exact type check sidesteps ABCMeta.__instancecheck__, which BaseLocalFileSystem inherits from
+        # Protocol, and ensures subclasses that override ``open`` are not bypassed via pathsend
+        self.is_local_file_system = type(self.adapter.file_system) is BaseLocalFileSystem
 
         if file_info:
             self.file_info: FileInfo | Coroutine[Any, Any, FileInfo] = file_info
@@ -229,6 +251,72 @@ class ASGIFileResponse(ASGIStreamingResponse):
 
         await super().start_response(send=send)
 
+    def _matches_if_none_match(self, scope: Scope) -> bool:
+        """Determine whether the request's ``If-None-Match`` header matches the response etag.
+
+        Args:
+            scope: The ASGI connection scope.
+
+        Returns:
+            ``True`` if the etag matches and a ``304 Not Modified`` response can be sent.
+        """
+        if self.etag is None or self.etag.value is None:
+            return False
+
+        if_none_match = next((value for name, value in scope.get("headers") or () if name == b"if-none-match"), None)
+        if if_none_match is None:
+            return False
+
+        tags = [tag.strip() for tag in if_none_match.decode("latin-1").split(",")]
+        quoted_value = f'"{self.etag.value}"'
+        # RFC 9110 prescribes weak comparison for If-None-Match, so the weakness indicator is ignored
+        return "*" in tags or any((tag[2:] if tag.startswith("W/") else tag) == quoted_value for tag in tags)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI callable of the ``Response``.
+
+        If the response has a pre-computed etag that matches the request's ``If-None-Match`` header, a
+        ``304 Not Modified`` response carrying the response headers and cookies is sent instead of the file
+        content.
+
+        If the file is served from the local file system and the connected server advertises support for the
+        ``http.response.pathsend`` extension, send a single ``http.response.pathsend`` event instead of streaming
+        the file content, delegating the byte copy to the server.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+
+        Returns:
+            None
+        """
+        if self.etag is not None and self._matches_if_none_match(scope):
+            # reuse start_response so the 304 carries the headers and cookies the 200 would have
+            # sent, as prescribed by RFC 9110 section 15.4.5, with an empty body instead of the file
+            self.status_code = HTTP_304_NOT_MODIFIED
+            await self.start_response(send=send)
+            body_event: HTTPResponseBodyEvent = {"type": "http.response.body", "body": b"", "more_body": False}
+            await send(body_event)
+            await self.after_response()
+            return
+
+        if (
+            self.is_local_file_system
+            and not self.is_head_response
+            and "http.response.pathsend" in (scope.get("extensions") or {})
+        ):
+            await self.start_response(send=send)
+            pathsend_event: HTTPResponsePathsendEvent = {
+                "type": "http.response.pathsend",
+                "path": fspath(self.file_path),
+            }
+            await send(pathsend_event)
+            await self.after_response()
+            return
+
+        await super().__call__(scope, receive, send)
+
 
 class File(Response):
     """A response, streaming a file as response body."""
@@ -252,7 +340,7 @@ class File(Response):
         chunk_size: int = ONE_MEGABYTE,
         content_disposition_type: Literal["attachment", "inline"] = "attachment",
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         etag: ETag | None = None,
         file_info: FileInfo | Coroutine[Any, Any, FileInfo] | None = None,
         file_system: FileSystemProtocol | None = None,
@@ -293,10 +381,17 @@ class File(Response):
             status_code: An HTTP status code.
         """
 
-        if file_system is not None and not (
-            callable(getattr(file_system, "info", None)) and callable(getattr(file_system, "open", None))
-        ):
-            raise ImproperlyConfiguredException("file_system must adhere to the FileSystemProtocol type")
+        if file_system is not None and type(file_system) not in _validated_file_system_types:
+            if not (callable(getattr(file_system, "info", None)) and callable(getattr(file_system, "open", None))):
+                raise ImproperlyConfiguredException("file_system must adhere to the FileSystemProtocol type")
+            _validated_file_system_types.add(type(file_system))
+
+        if etag is None and stat_result is not None:
+            # compute the etag eagerly from the stat result that is already at hand, so it is derived once per
+            # ``File`` instance rather than on every send, and conditional requests can short-circuit to a 304
+            etag = ETag.from_header(
+                create_etag_for_file(path=path, modified_time=stat_result.st_mtime, file_size=stat_result.st_size)
+            )
 
         self.chunk_size = chunk_size
         self.content_disposition_type = content_disposition_type
@@ -366,10 +461,8 @@ class File(Response):
 
         return ASGIFileResponse(
             background=self.background or background,
-            body=b"",
             chunk_size=self.chunk_size,
             content_disposition_type=self.content_disposition_type,  # pyright: ignore
-            content_length=0,
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import itertools
 from typing import TYPE_CHECKING, Any, Iterable, Literal
 
-from litestar.constants import REDIRECT_ALLOWED_MEDIA_TYPES, REDIRECT_STATUS_CODES
+from litestar.constants import REDIRECT_ALLOWED_MEDIA_TYPES, REDIRECT_STATUS_CODES, UTF8
 from litestar.enums import MediaType
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response.base import ASGIResponse, Response
@@ -32,6 +32,8 @@ RedirectStatusType = Literal[301, 302, 303, 307, 308]
 class ASGIRedirectResponse(ASGIResponse):
     """A low-level ASGI redirect response class."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | bytes,
@@ -43,7 +45,7 @@ class ASGIRedirectResponse(ASGIResponse):
         body: bytes | str = b"",
         content_length: int | None = None,
         cookies: Iterable[Cookie] | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         is_head_response: bool = False,
     ) -> None:
         headers = {**(headers or {}), "location": url_quote(path)}
@@ -89,7 +91,7 @@ class Redirect(Response[Any]):
         *,
         background: BackgroundTask | BackgroundTasks | None = None,
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: ResponseHeaders | None = None,
         media_type: str | MediaType | None = None,
         status_code: RedirectStatusType | None = None,
@@ -157,8 +159,6 @@ class Redirect(Response[Any]):
         return ASGIRedirectResponse(
             path=self.url,
             background=self.background or background,
-            body=b"",
-            content_length=None,
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
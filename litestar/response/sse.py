@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterable, AsyncIterator,
 
 from anyio.to_thread import run_sync
 
+from litestar.constants import UTF8
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response.streaming import Stream
 from litestar.utils import AsyncIteratorWrapper
@@ -74,13 +75,15 @@ class _ServerSentEventIterator(AsyncIteratorWrapper[bytes]):
 
 
 class ServerSentEvent(Stream):
+    __slots__ = ()
+
     def __init__(
         self,
         content: str | bytes | StreamType[str | bytes],
         *,
         background: BackgroundTask | BackgroundTasks | None = None,
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: ResponseHeaders | None = None,
         event_type: str | None = None,
         event_id: int | None = None,
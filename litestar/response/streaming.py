@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import itertools
 from functools import partial
-from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Union
+from types import AsyncGeneratorType, GeneratorType
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterable, Callable, Iterable, Union, cast
 
 from anyio import CancelScope, create_task_group
 
+from litestar.constants import UTF8
 from litestar.enums import MediaType
 from litestar.response.base import ASGIResponse, Response
 from litestar.types.helper_types import StreamType
@@ -26,6 +28,9 @@ __all__ = (
     "Stream",
 )
 
+_KNOWN_ITERATOR_TYPES = (list, tuple, bytes, str, GeneratorType, AsyncGeneratorType)
+"""Concrete types that are known to be iterators or iterables, allowing the dunder probe to be skipped."""
+
 
 class ASGIStreamingResponse(ASGIResponse):
     """A streaming response."""
@@ -43,7 +48,7 @@ class ASGIStreamingResponse(ASGIResponse):
         content_length: int | None = None,
         cookies: Iterable[Cookie] | None = None,
         encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: dict[str, Any] | None = None,
         is_head_response: bool = False,
         media_type: MediaType | str | None = None,
@@ -77,7 +82,9 @@ class ASGIStreamingResponse(ASGIResponse):
             encoded_headers=encoded_headers,
         )
         self.iterator: AsyncIterable[str | bytes] | AsyncGenerator[str | bytes, None] = (
-            iterator if isinstance(iterator, (AsyncIterable, AsyncIterator)) else AsyncIteratorWrapper(iterator)
+            cast("AsyncIterable[str | bytes]", iterator)
+            if hasattr(type(iterator), "__aiter__")
+            else AsyncIteratorWrapper(cast("Iterable[str | bytes]", iterator))
         )
 
     async def _listen_for_disconnect(self, cancel_scope: CancelScope, receive: Receive) -> None:
@@ -145,7 +152,7 @@ class Stream(Response[StreamType[Union[str, bytes]]]):
         *,
         background: BackgroundTask | BackgroundTasks | None = None,
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: ResponseHeaders | None = None,
         media_type: MediaType | OpenAPIMediaType | str | None = None,
         status_code: int | None = None,
@@ -221,13 +228,14 @@ class Stream(Response[StreamType[Union[str, bytes]]]):
         media_type = get_enum_string_value(media_type or self.media_type or MediaType.JSON)
 
         iterator = self.iterator
-        if not isinstance(iterator, (Iterable, Iterator, AsyncIterable, AsyncIterator)) and callable(iterator):
-            iterator = iterator()
+        if not isinstance(iterator, _KNOWN_ITERATOR_TYPES):
+            # probe the type rather than the instance, mirroring how isinstance dispatches on dunder methods
+            iterator_type = type(iterator)
+            if not (hasattr(iterator_type, "__iter__") or hasattr(iterator_type, "__aiter__")) and callable(iterator):
+                iterator = iterator()
 
         return ASGIStreamingResponse(
             background=self.background or background,
-            body=b"",
-            content_length=0,
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
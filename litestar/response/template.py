@@ -5,7 +5,7 @@ from mimetypes import guess_type
 from pathlib import PurePath
 from typing import TYPE_CHECKING, Any, Iterable
 
-from litestar.constants import SCOPE_STATE_CSRF_TOKEN_KEY
+from litestar.constants import SCOPE_STATE_CSRF_TOKEN_KEY, UTF8
 from litestar.enums import MediaType
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response.base import ASGIResponse, Response
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 
 __all__ = ("Template",)
 
+_CSRF_INPUT_PREFIX = '<input type="hidden" name="_csrf_token" value="'
+_CSRF_INPUT_SUFFIX = '" />'
+_EMPTY_CSRF_INPUT = _CSRF_INPUT_PREFIX + _CSRF_INPUT_SUFFIX
+
 
 class Template(Response[bytes]):
     """Template-based response, rendering a given template into a bytes string."""
@@ -38,7 +42,7 @@ class Template(Response[bytes]):
         background: BackgroundTask | BackgroundTasks | None = None,
         context: dict[str, Any] | None = None,
         cookies: ResponseCookies | None = None,
-        encoding: str = "utf-8",
+        encoding: str = UTF8,
         headers: dict[str, Any] | None = None,
         media_type: MediaType | str | None = None,
         status_code: int = HTTP_200_OK,
@@ -81,11 +85,12 @@ class Template(Response[bytes]):
             A dictionary holding the template context
         """
         csrf_token = get_litestar_scope_state(scope=request.scope, key=SCOPE_STATE_CSRF_TOKEN_KEY, default="")
-        return {
-            **self.context,
-            "request": request,
-            "csrf_input": f'<input type="hidden" name="_csrf_token" value="{csrf_token}" />',
-        }
+        context = self.context.copy()
+        context["request"] = request
+        context["csrf_input"] = (
+            _CSRF_INPUT_PREFIX + csrf_token + _CSRF_INPUT_SUFFIX if csrf_token else _EMPTY_CSRF_INPUT
+        )
+        return context
 
     def to_asgi_response(
         self,
@@ -110,9 +115,6 @@ class Template(Response[bytes]):
                 alternative="request.app",
             )
 
-        if not request.app.template_engine:
-            raise ImproperlyConfiguredException("Template engine is not configured")
-
         headers = {**headers, **self.headers} if headers is not None else self.headers
         cookies = self.cookies if cookies is None else itertools.chain(self.cookies, cookies)
 
@@ -126,14 +128,18 @@ class Template(Response[bytes]):
             else:
                 media_type = MediaType.TEXT
 
-        template = request.app.template_engine.get_template(self.template_name)
+        # handlers annotated as returning Template fail at registration time already, but a handler with a
+        # wider return annotation can still hand back a Template on an engine-less app
+        if (template_engine := request.app.template_engine) is None:
+            raise ImproperlyConfiguredException("Template engine is not configured")
+
+        template = template_engine.get_template(self.template_name)
         context = self.create_template_context(request)
         body = template.render(**context).encode(self.encoding)
 
         return ASGIResponse(
             background=self.background or background,
             body=body,
-            content_length=None,
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
@@ -6,6 +6,7 @@ from .asgi_types import (
     HTTPReceiveMessage,
     HTTPRequestEvent,
     HTTPResponseBodyEvent,
+    HTTPResponsePathsendEvent,
     HTTPResponseStartEvent,
     HTTPScope,
     HTTPSendMessage,
@@ -114,6 +115,7 @@ __all__ = (
     "HTTPReceiveMessage",
     "HTTPRequestEvent",
     "HTTPResponseBodyEvent",
+    "HTTPResponsePathsendEvent",
     "HTTPResponseStartEvent",
     "HTTPScope",
     "HTTPSendMessage",
@@ -55,6 +55,7 @@ __all__ = (
     "HTTPReceiveMessage",
     "HTTPRequestEvent",
     "HTTPResponseBodyEvent",
+    "HTTPResponsePathsendEvent",
     "HTTPResponseStartEvent",
     "HTTPScope",
     "HTTPSendMessage",
@@ -187,6 +188,13 @@ class HTTPResponseBodyEvent(TypedDict):
     more_body: bool
 
 
+class HTTPResponsePathsendEvent(TypedDict):
+    """ASGI `http.response.pathsend` extension event."""
+
+    type: Literal["http.response.pathsend"]
+    path: str
+
+
 class HTTPServerPushEvent(HeaderScope):
     """ASGI `http.response.push` event."""
 
@@ -313,6 +321,7 @@ LifeSpanReceiveMessage: TypeAlias = Union[
 HTTPSendMessage: TypeAlias = Union[
     HTTPResponseStartEvent,
     HTTPResponseBodyEvent,
+    HTTPResponsePathsendEvent,
     HTTPServerPushEvent,
     HTTPDisconnectEvent,
 ]
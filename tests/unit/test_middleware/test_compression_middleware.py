@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import AsyncIterator, Callable, Literal
 from unittest.mock import MagicMock
 
@@ -5,10 +6,12 @@ import pytest
 
 from litestar import MediaType, WebSocket, get, websocket
 from litestar.config.compression import CompressionConfig
+from litestar.connection.base import empty_receive
 from litestar.enums import CompressionEncoding
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.handlers import HTTPRouteHandler
 from litestar.middleware.compression import CompressionMiddleware
+from litestar.response.file import ASGIFileResponse
 from litestar.response.streaming import Stream
 from litestar.status_codes import HTTP_200_OK
 from litestar.testing import create_test_client
@@ -216,3 +219,32 @@ def test_dont_recompress_cached(backend: Literal["gzip", "brotli"], compression_
     assert response.text == "_litestar_" * 4000
     assert response.headers["Content-Encoding"] == compression_encoding
     assert int(response.headers["Content-Length"]) < 40000
+
+
+@pytest.mark.parametrize(
+    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
+)
+async def test_compression_forwards_pathsend_events(
+    backend: Literal["gzip", "brotli"],
+    compression_encoding: Literal[CompressionEncoding.BROTLI, CompressionEncoding.GZIP],
+    create_scope: Callable[..., Scope],
+    mock_asgi_app: ASGIApp,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+
+    mock = MagicMock()
+
+    async def fake_send(message: Message) -> None:
+        mock(message)
+
+    scope = create_scope(extensions={"http.response.pathsend": {}})
+    wrapped_send = CompressionMiddleware(
+        mock_asgi_app, CompressionConfig(backend=backend)
+    ).create_compression_send_wrapper(fake_send, compression_encoding, scope)
+
+    await ASGIFileResponse(file_path=path, filename="file.txt")(scope, empty_receive, wrapped_send)
+
+    assert mock.mock_calls[0].args[0]["type"] == "http.response.start"
+    assert mock.mock_calls[-1].args[0] == {"type": "http.response.pathsend", "path": str(path)}
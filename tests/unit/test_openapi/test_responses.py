@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from http import HTTPStatus
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable, Dict, TypedDict
+from typing import Any, Callable, Dict, TypedDict, cast
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,6 +18,7 @@ from litestar._openapi.responses import (
     create_success_response,
 )
 from litestar._openapi.schema_generation import SchemaCreator
+from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.datastructures import Cookie, ResponseHeader
 from litestar.dto import AbstractDTO
 from litestar.exceptions import (
@@ -38,6 +39,7 @@ from litestar.status_codes import (
     HTTP_400_BAD_REQUEST,
     HTTP_406_NOT_ACCEPTABLE,
 )
+from litestar.template.config import TemplateConfig
 from litestar.typing import FieldDefinition
 from tests.models import DataclassPerson, DataclassPersonFactory
 from tests.unit.test_openapi.utils import PetException
@@ -300,12 +302,16 @@ def test_create_success_response_file_data() -> None:
     assert response.headers["etag"].description
 
 
-def test_create_success_response_template() -> None:
+def test_create_success_response_template(tmp_path: Path) -> None:
     @get(path="/template", name="test")
     def template_handler() -> Template:
         return Template(template_name="none")
 
-    handler = get_registered_route_handler(template_handler, "test")
+    app = Litestar(
+        route_handlers=[template_handler],
+        template_config=TemplateConfig(engine=JinjaTemplateEngine, directory=tmp_path),
+    )
+    handler = cast("HTTPRouteHandler", app.asgi_router.route_handler_index["test"])
 
     response = create_success_response(handler, SchemaCreator(generate_examples=True))
     assert response.description == "Request fulfilled, document follows"
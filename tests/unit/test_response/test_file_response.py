@@ -9,11 +9,11 @@ from fsspec.implementations.local import LocalFileSystem
 
 from litestar import get
 from litestar.connection.base import empty_send
-from litestar.datastructures import ETag
+from litestar.datastructures import Cookie, ETag
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
-from litestar.response.file import ASGIFileResponse, File, async_file_iterator
-from litestar.status_codes import HTTP_200_OK
+from litestar.response.file import ASGIFileResponse, File, async_file_iterator, create_etag_for_file
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 from litestar.testing import create_test_client
 from litestar.types import FileSystemProtocol
 
@@ -322,3 +322,96 @@ def test_asgi_response_encoded_headers(file: Path) -> None:
         (b"content-type", b"application/octet-stream"),
         (b"content-disposition", b'attachment; filename=""'),
     ]
+
+
+async def test_file_response_pathsend_extension(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    asgi_response = ASGIFileResponse(file_path=path, filename="file.txt")
+    events: list = []
+
+    async def send(event: object) -> None:
+        events.append(event)
+
+    scope = {"type": "http", "extensions": {"http.response.pathsend": {}}}
+    await asgi_response(scope, empty_send, send)  # type: ignore[arg-type]
+
+    assert events[0]["type"] == "http.response.start"
+    assert dict(events[0]["headers"])[b"content-length"] == b"7"
+    assert events[-1] == {"type": "http.response.pathsend", "path": str(path)}
+
+
+async def test_file_response_pathsend_not_used_without_extension(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path, filename="file.txt")
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        assert response.content == b"content"
+
+
+async def test_file_response_pathsend_not_used_for_non_local_file_system(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    asgi_response = ASGIFileResponse(file_path=path, filename="file.txt", file_system=LocalFileSystem())
+    events: list = []
+
+    async def send(event: object) -> None:
+        events.append(event)
+
+    scope = {"type": "http", "extensions": {"http.response.pathsend": {}}}
+    await asgi_response(scope, empty_send, send)  # type: ignore[arg-type]
+
+    assert events[0]["type"] == "http.response.start"
+    assert all(event["type"] != "http.response.pathsend" for event in events)
+
+
+def test_file_etag_precomputed_from_stat_result(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+    stat_result = stat(path)
+
+    file_response = File(path=path, stat_result=stat_result)
+
+    assert file_response.etag == ETag.from_header(
+        create_etag_for_file(path=path, modified_time=stat_result.st_mtime, file_size=stat_result.st_size)
+    )
+
+
+def test_file_response_if_none_match_returns_304(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/")
+    def handler() -> File:
+        return File(
+            path=path,
+            filename="file.txt",
+            stat_result=stat(path),
+            headers={"cache-control": "max-age=60"},
+            cookies=[Cookie(key="foo", value="bar")],
+        )
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        etag = response.headers["etag"]
+
+        cached_response = client.get("/", headers={"If-None-Match": etag})
+        assert cached_response.status_code == HTTP_304_NOT_MODIFIED
+        assert cached_response.headers["etag"] == etag
+        assert cached_response.headers["cache-control"] == "max-age=60"
+        assert "last-modified" in cached_response.headers
+        assert cached_response.cookies["foo"] == "bar"
+        assert not cached_response.content
+
+        fresh_response = client.get("/", headers={"If-None-Match": '"does-not-match"'})
+        assert fresh_response.status_code == HTTP_200_OK
+        assert fresh_response.content == b"content"
@@ -4,12 +4,13 @@ from typing import TYPE_CHECKING, Optional, Type, Union
 
 import pytest
 
-from litestar import Litestar, MediaType, get
+from litestar import Litestar, MediaType, Response, get
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.contrib.mako import MakoTemplateEngine
 from litestar.contrib.minijinja import MiniJinjaTemplateEngine
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response.template import Template
+from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR
 from litestar.template.config import TemplateConfig
 from litestar.testing import create_test_client
 
@@ -23,10 +24,18 @@ def test_handler_raise_for_no_template_engine() -> None:
     def invalid_path() -> Template:
         return Template(template_name="index.html", context={"ye": "yeeee"})
 
-    with create_test_client(route_handlers=[invalid_path], debug=False) as client:
+    with pytest.raises(ImproperlyConfiguredException, match="Template engine is not configured"):
+        create_test_client(route_handlers=[invalid_path], debug=False)
+
+
+def test_handler_raise_for_no_template_engine_at_runtime() -> None:
+    @get(path="/")
+    def wide_annotation() -> Response:
+        return Template(template_name="index.html", context={"ye": "yeeee"})
+
+    with create_test_client(route_handlers=[wide_annotation], debug=False) as client:
         response = client.request("GET", "/")
-        assert response.status_code == 500
-        assert response.json() == {"detail": "Internal Server Error", "status_code": 500}
+        assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
 
 
 def test_engine_passed_to_callback(tmp_path: "Path") -> None: